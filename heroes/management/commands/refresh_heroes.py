@@ -0,0 +1,131 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+
+from heroes.models import Hero
+from heroes.services import SuperheroAPIService, POWERSTAT_FIELDS, extract_powerstats
+
+
+class Command(BaseCommand):
+    """
+    Refresh the powerstats of stored heroes from Superhero API.
+
+    Heroes are processed in primary key order, in batches of --batch-size.
+    Each batch is re-fetched by api_id using at most --workers concurrent
+    requests, and only heroes whose powerstats changed are written back
+    with a single bulk_update. After every batch the last processed primary
+    key and the api_ids that failed to refresh are saved to --checkpoint.
+    If any hero failed, the checkpoint is kept and the command exits with an
+    error; running it again with --resume retries the failed heroes and
+    continues after the last processed primary key.
+    """
+    help = 'Refresh powerstats of stored heroes from Superhero API.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help='Number of heroes fetched and updated per batch.')
+        parser.add_argument('--workers', type=int, default=8,
+                            help='Maximum number of concurrent requests to Superhero API.')
+        parser.add_argument('--checkpoint', default='refresh_heroes.checkpoint',
+                            help='Path of the file used to store progress.')
+        parser.add_argument('--resume', action='store_true',
+                            help='Retry failed heroes and continue from the last saved checkpoint.')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        workers = options['workers']
+        checkpoint = options['checkpoint']
+        if batch_size < 1:
+            raise CommandError('--batch-size must be positive')
+        if workers < 1:
+            raise CommandError('--workers must be positive')
+
+        last_pk, retry_ids = self.load_checkpoint(checkpoint) if options['resume'] else (0, [])
+        service = SuperheroAPIService()
+        failed_ids = set()
+        checked = updated = 0
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for start in range(0, len(retry_ids), batch_size):
+                heroes = list(
+                    Hero.objects.filter(api_id__in=retry_ids[start:start + batch_size])
+                    .only('pk', 'api_id', *POWERSTAT_FIELDS)
+                )
+                batch_updated, batch_failed = self.refresh(executor, service, heroes)
+                checked += len(heroes)
+                updated += batch_updated
+                failed_ids.update(batch_failed)
+                pending_ids = failed_ids.union(retry_ids[start + batch_size:])
+                self.save_checkpoint(checkpoint, last_pk, pending_ids)
+
+            while True:
+                heroes = list(
+                    Hero.objects.filter(pk__gt=last_pk)
+                    .order_by('pk')
+                    .only('pk', 'api_id', *POWERSTAT_FIELDS)[:batch_size]
+                )
+                if not heroes:
+                    break
+
+                batch_updated, batch_failed = self.refresh(executor, service, heroes)
+                checked += len(heroes)
+                updated += batch_updated
+                failed_ids.update(batch_failed)
+                last_pk = heroes[-1].pk
+                self.save_checkpoint(checkpoint, last_pk, failed_ids)
+
+        summary = f'Checked {checked} heroes, updated {updated}, failed {len(failed_ids)}.'
+        if failed_ids:
+            raise CommandError(
+                f'{summary} Failed heroes are recorded in {checkpoint}; rerun with --resume to retry them.'
+            )
+
+        if os.path.exists(checkpoint):
+            os.remove(checkpoint)
+
+        self.stdout.write(self.style.SUCCESS(summary))
+
+    def refresh(self, executor, service, heroes):
+        changed = []
+        failed = []
+        results = executor.map(lambda hero: self.fetch(service, hero), heroes)
+        for hero, stats in zip(heroes, results):
+            if stats is None:
+                failed.append(hero.api_id)
+                continue
+            if any(getattr(hero, field) != value for field, value in stats.items()):
+                for field, value in stats.items():
+                    setattr(hero, field, value)
+                changed.append(hero)
+
+        if changed:
+            Hero.objects.bulk_update(changed, POWERSTAT_FIELDS)
+        return len(changed), failed
+
+    def fetch(self, service, hero):
+        try:
+            result = service.get_hero_by_id(hero.api_id)
+            if result.get('response') != 'success':
+                raise ValueError(result.get('error', 'Hero not found'))
+            return extract_powerstats(result)
+        except Exception as e:
+            self.stderr.write(f'Failed to refresh hero {hero.api_id}: {e}')
+            return None
+
+    def load_checkpoint(self, path):
+        if not os.path.exists(path):
+            return 0, []
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            return int(data['last_pk']), [int(api_id) for api_id in data.get('failed', [])]
+        except (ValueError, KeyError, TypeError) as e:
+            raise CommandError(f'Invalid checkpoint file {path}: {e}')
+
+    def save_checkpoint(self, path, last_pk, failed_ids):
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'last_pk': last_pk, 'failed': sorted(failed_ids)}, f)
+        os.replace(tmp_path, path)
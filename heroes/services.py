@@ -1,13 +1,39 @@
 import requests
 import os
+import threading
 
 class SuperheroAPIService:
     def __init__(self):
         self.base_url = "https://superheroapi.com/api"
         self.api_token = os.getenv('SUPERHERO_API_TOKEN')
+        self.timeout = 10
+        self._local = threading.local()
+
+    @property
+    def session(self):
+        # One session per thread, so concurrent callers reuse their own connections.
+        if not hasattr(self._local, 'session'):
+            self._local.session = requests.Session()
+        return self._local.session
 
     def get_hero_by_name(self, name):
         url = f"{self.base_url}/{self.api_token}/search/{name}"
         response = requests.get(url)
         response.raise_for_status()
-        return response.json()
\ No newline at end of file
+        return response.json()
+
+    def get_hero_by_id(self, api_id):
+        url = f"{self.base_url}/{self.api_token}/{api_id}"
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+
+POWERSTAT_FIELDS = ('intelligence', 'strength', 'speed', 'power')
+
+
+def extract_powerstats(result):
+    return {
+        field: int(result['powerstats'].get(field, 0) or 0)
+        for field in POWERSTAT_FIELDS
+    }
\ No newline at end of file
@@ -1,10 +1,14 @@
 import pytest
 import json
+import importlib
 import requests_mock
 from rest_framework.test import APIClient
 from django.urls import reverse
 from heroes.models import Hero
+from django.core.management import call_command, CommandError
+from django.test import RequestFactory
 from heroes.services import SuperheroAPIService
+from superhero_api import schema, urls
 
 @pytest.fixture
 def client():
@@ -286,4 +290,135 @@ def test_redoc_accessible(client):
     assert response.status_code == 200
     content = response.content.decode()
     assert 'Superhero API' in content  # Check for page title
-    assert 'redoc.min.js' in content  # Check for ReDoc script
\ No newline at end of file
+    assert 'redoc.min.js' in content  # Check for ReDoc script
+
+def mock_hero_by_id(mock_superhero_api, api_id, name, intelligence, strength, speed, power):
+    mock_superhero_api.get(
+        f"https://superheroapi.com/api/{SuperheroAPIService().api_token}/{api_id}",
+        json={
+            "response": "success",
+            "id": str(api_id),
+            "name": name,
+            "powerstats": {
+                "intelligence": str(intelligence),
+                "strength": str(strength),
+                "speed": str(speed),
+                "power": str(power)
+            }
+        }
+    )
+
+@pytest.mark.django_db
+def test_refresh_heroes_updates_changed_stats(mock_superhero_api, tmp_path):
+    Hero.objects.create(api_id=644, name='Superman', intelligence=94, strength=100, speed=100, power=100)
+    Hero.objects.create(api_id=70, name='Batman', intelligence=100, strength=26, speed=27, power=47)
+    mock_hero_by_id(mock_superhero_api, 644, 'Superman', 94, 100, 100, 100)
+    mock_hero_by_id(mock_superhero_api, 70, 'Batman', 100, 40, 29, 63)
+    checkpoint = tmp_path / 'refresh.checkpoint'
+    call_command('refresh_heroes', batch_size=1, workers=2, checkpoint=str(checkpoint))
+    batman = Hero.objects.get(api_id=70)
+    assert (batman.intelligence, batman.strength, batman.speed, batman.power) == (100, 40, 29, 63)
+    superman = Hero.objects.get(api_id=644)
+    assert (superman.intelligence, superman.strength, superman.speed, superman.power) == (94, 100, 100, 100)
+    assert not checkpoint.exists()
+
+@pytest.mark.django_db
+def test_refresh_heroes_keeps_stats_on_api_error(mock_superhero_api, tmp_path):
+    Hero.objects.create(api_id=644, name='Superman', intelligence=94, strength=100, speed=100, power=100)
+    mock_superhero_api.get(
+        f"https://superheroapi.com/api/{SuperheroAPIService().api_token}/644",
+        status_code=500
+    )
+    checkpoint = tmp_path / 'refresh.checkpoint'
+    with pytest.raises(CommandError):
+        call_command('refresh_heroes', checkpoint=str(checkpoint))
+    superman = Hero.objects.get(api_id=644)
+    assert superman.strength == 100
+    assert json.loads(checkpoint.read_text())['failed'] == [644]
+
+@pytest.mark.django_db
+def test_refresh_heroes_retries_failed_heroes_on_resume(mock_superhero_api, tmp_path):
+    superman = Hero.objects.create(api_id=644, name='Superman', intelligence=94, strength=100, speed=100, power=100)
+    mock_hero_by_id(mock_superhero_api, 644, 'Superman', 94, 90, 100, 100)
+    checkpoint = tmp_path / 'refresh.checkpoint'
+    checkpoint.write_text(json.dumps({'last_pk': superman.pk, 'failed': [644]}))
+    call_command('refresh_heroes', checkpoint=str(checkpoint), resume=True)
+    assert Hero.objects.get(api_id=644).strength == 90
+    assert not checkpoint.exists()
+
+@pytest.mark.django_db
+def test_refresh_heroes_resumes_from_checkpoint(mock_superhero_api, tmp_path):
+    superman = Hero.objects.create(api_id=644, name='Superman', intelligence=94, strength=100, speed=100, power=100)
+    Hero.objects.create(api_id=70, name='Batman', intelligence=100, strength=26, speed=27, power=47)
+    mock_hero_by_id(mock_superhero_api, 70, 'Batman', 100, 40, 29, 63)
+    checkpoint = tmp_path / 'refresh.checkpoint'
+    checkpoint.write_text(json.dumps({'last_pk': superman.pk}))
+    call_command('refresh_heroes', checkpoint=str(checkpoint), resume=True)
+    assert Hero.objects.get(api_id=70).strength == 40
+    assert mock_superhero_api.call_count == 1
+
+@pytest.fixture
+def precomputed_schema(settings, tmp_path):
+    settings.SCHEMA_FILE = tmp_path / 'openapi.json'
+    schema.load_schema.cache_clear()
+    yield settings.SCHEMA_FILE
+    schema.load_schema.cache_clear()
+
+def test_precomputed_schema_served_from_file(precomputed_schema, settings):
+    settings.SCHEMA_CACHE_TIMEOUT = 120
+    precomputed_schema.write_text(json.dumps({'swagger': '2.0', 'info': {'title': 'Superhero API'}}))
+    response = schema.schema_json(RequestFactory().get('/swagger.json'))
+    assert response.status_code == 200
+    assert json.loads(response.content)['info']['title'] == 'Superhero API'
+    assert 'max-age=120' in response['Cache-Control']
+
+def test_precomputed_schema_generated_when_missing(precomputed_schema):
+    response = schema.schema_json(RequestFactory().get('/swagger.json'))
+    assert response.status_code == 200
+    data = json.loads(response.content)
+    assert '/hero/' in data['paths']
+    assert data['basePath'] == '/api'
+
+def reload_urls(settings, live):
+    settings.SCHEMA_LIVE = live
+    importlib.reload(urls)
+    settings.ROOT_URLCONF = 'superhero_api.urls'  # clears the resolver cache
+
+@pytest.fixture
+def precomputed_urls(settings, precomputed_schema):
+    live = settings.SCHEMA_LIVE
+    reload_urls(settings, False)
+    yield
+    reload_urls(settings, live)
+
+@pytest.mark.django_db
+def test_precomputed_swagger_ui_points_to_schema(client, precomputed_urls):
+    response = client.get('/swagger/')
+    assert response.status_code == 200
+    content = response.content.decode()
+    assert 'Superhero API' in content
+    assert 'swagger-ui' in content
+    assert '/swagger.json' in content
+
+@pytest.mark.django_db
+def test_precomputed_redoc_points_to_schema(client, precomputed_urls):
+    response = client.get('/redoc/')
+    assert response.status_code == 200
+    content = response.content.decode()
+    assert 'redoc.min.js' in content
+    assert '/swagger.json' in content
+
+@pytest.fixture(params=[True, False], ids=['live', 'precomputed'])
+def schema_mode_client(request, settings, precomputed_schema):
+    live = settings.SCHEMA_LIVE
+    reload_urls(settings, request.param)
+    yield APIClient()
+    reload_urls(settings, live)
+
+@pytest.mark.django_db
+def test_swagger_json_route_returns_json(schema_mode_client):
+    response = schema_mode_client.get('/swagger.json', HTTP_ACCEPT='*/*')
+    assert response.status_code == 200
+    assert response['Content-Type'].startswith('application/json')
+    data = json.loads(response.content)
+    assert '/hero/' in data['paths']
@@ -6,7 +6,7 @@ from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from .models import Hero
 from .serializers import HeroSerializer
-from .services import SuperheroAPIService
+from .services import SuperheroAPIService, extract_powerstats
 
 class HeroView(APIView):
     """
@@ -59,10 +59,7 @@ class HeroView(APIView):
                         data = {
                             'api_id': result['id'],
                             'name': result['name'],
-                            'intelligence': int(result['powerstats'].get('intelligence', 0) or 0),
-                            'strength': int(result['powerstats'].get('strength', 0) or 0),
-                            'speed': int(result['powerstats'].get('speed', 0) or 0),
-                            'power': int(result['powerstats'].get('power', 0) or 0),
+                            **extract_powerstats(result),
                         }
                         serializer = HeroSerializer(data=data)
                         if serializer.is_valid():
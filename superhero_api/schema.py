@@ -0,0 +1,62 @@
+"""
+Serving of the precomputed OpenAPI schema and its documentation pages.
+
+Used when SCHEMA_LIVE is disabled. The schema is read once per process from
+SCHEMA_FILE, which is generated at build time with
+`python manage.py generate_swagger`. If the file is missing, a warning is
+logged and the schema is generated on first request and kept in memory, so
+drf_yasg is only imported in that case.
+"""
+
+import logging
+from functools import lru_cache
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.shortcuts import render
+from django.urls import reverse
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import require_GET
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def load_schema():
+    try:
+        with open(settings.SCHEMA_FILE, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        logger.warning('Precomputed schema %s not found, generating it with drf_yasg', settings.SCHEMA_FILE)
+        return generate_schema()
+
+
+def generate_schema():
+    from drf_yasg.codecs import OpenAPICodecJson
+    from drf_yasg.generators import OpenAPISchemaGenerator
+    from .openapi_info import api_info
+
+    generator = OpenAPISchemaGenerator(api_info)
+    schema = generator.get_schema(request=None, public=True)
+    return OpenAPICodecJson(validators=[]).encode(schema)
+
+
+def cache_publicly(response):
+    # Read the timeout per response so changes to SCHEMA_CACHE_TIMEOUT apply without a reload.
+    patch_cache_control(response, public=True, max_age=settings.SCHEMA_CACHE_TIMEOUT)
+    return response
+
+
+@require_GET
+def schema_json(request):
+    return cache_publicly(HttpResponse(load_schema(), content_type='application/json'))
+
+
+@require_GET
+def swagger_ui(request):
+    return cache_publicly(render(request, 'swagger-ui.html', {'spec_url': reverse('schema-json')}))
+
+
+@require_GET
+def redoc(request):
+    return cache_publicly(render(request, 'redoc.html', {'spec_url': reverse('schema-json')}))
@@ -42,7 +42,7 @@ ROOT_URLCONF = 'superhero_api.urls'
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
-        'DIRS': [],
+        'DIRS': [BASE_DIR / 'templates'],
         'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
@@ -91,4 +91,14 @@ USE_TZ = True
 STATIC_URL = 'static/'
 STATIC_ROOT = BASE_DIR / 'static'
 
+SWAGGER_SETTINGS = {
+    'DEFAULT_INFO': 'superhero_api.openapi_info.api_info',
+}
+
+# When False, /swagger/ and /redoc/ serve the schema precomputed into SCHEMA_FILE
+# instead of regenerating it with drf_yasg on every request.
+SCHEMA_LIVE = os.getenv('SCHEMA_LIVE', 'True') == 'True'
+SCHEMA_FILE = Path(os.getenv('SCHEMA_FILE', STATIC_ROOT / 'openapi.json'))
+SCHEMA_CACHE_TIMEOUT = int(os.getenv('SCHEMA_CACHE_TIMEOUT', '3600'))
+
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
\ No newline at end of file
@@ -1,25 +1,33 @@
+from django.conf import settings
 from django.contrib import admin
-from django.urls import path, include
-from rest_framework import permissions
-from drf_yasg.views import get_schema_view
-from drf_yasg import openapi
-
-schema_view = get_schema_view(
-    openapi.Info(
-        title="Superhero API",
-        default_version='v1',
-        description="API for managing superheroes, fetching data from Superhero API and storing in PostgreSQL.",
-        terms_of_service="https://www.example.com/terms/",
-        contact=openapi.Contact(email="contact@example.com"),
-        license=openapi.License(name="MIT License"),
-    ),
-    public=True,
-    permission_classes=(permissions.AllowAny,),
-)
+from django.urls import path, re_path, include
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/', include('heroes.urls')),
-    path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
-    path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
-]
\ No newline at end of file
+]
+
+if settings.SCHEMA_LIVE:
+    from rest_framework import permissions
+    from drf_yasg.views import get_schema_view
+    from .openapi_info import api_info
+
+    schema_view = get_schema_view(
+        api_info,
+        public=True,
+        permission_classes=(permissions.AllowAny,),
+    )
+
+    urlpatterns += [
+        re_path(r'^swagger(?P<format>\.json|\.yaml)$', schema_view.without_ui(cache_timeout=0), name='schema-json'),
+        path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
+        path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
+    ]
+else:
+    from . import schema
+
+    urlpatterns += [
+        path('swagger.json', schema.schema_json, name='schema-json'),
+        path('swagger/', schema.swagger_ui, name='schema-swagger-ui'),
+        path('redoc/', schema.redoc, name='schema-redoc'),
+    ]